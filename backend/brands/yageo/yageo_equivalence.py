@@ -0,0 +1,309 @@
+import argparse
+import json
+import random
+import string
+import sys
+import time
+from typing import Callable, Dict, List
+
+from brands.yageo import yageo_gen, yageo_reference
+
+# ============================================================
+# DIFFERENTIAL EQUIVALENCE HARNESS
+# ============================================================
+#
+# Every optimized substitution path must return exactly what the frozen
+# reference implementation returns (same keys, same order, same NOTE
+# suffixes, same exceptions). Run from the backend directory:
+#
+#     python -m brands.yageo.yageo_equivalence --count 5000 --seed 7
+
+# ============================================================
+# CORPUS
+# ============================================================
+
+CORPUS = [
+    # Customer part numbers seen in production
+    "RC0805FR-07205KL",
+    "RC0603FR-0757K6L",
+    "RC1206FR-074R99L",
+    "RC0603FR-0722KL",
+    "RC1206FR-07332KL",
+    "CC0603KRX5R7BB475",
+    "RC0402FR-0710RL",
+    "RC0402FR-0715KL",
+    "RC0402FR-0747KL",
+    "AC0402FR-0751RL",
+    "CC0402KRX5R7BB105",
+    "RC0402FR-071K2P",
+    "CC0402KRX7R7BB224",
+    "RT0603DRD07127RL",
+    "RC0603FR-0710KL",
+    "AC0201FR-0710KL",
+    "CC0201JRNPO9BN120",
+    "RC0201FR-07100RL",
+    "RC0402FR-07330KL",
+    # Normalizer and edge cases
+    " rc0402f-475rl ",
+    "CC0603",
+    "CC0603R",
+    "RC0603",
+    "271KD07",
+    "271KD07-TR",
+    "23",
+    "232270672613",
+    "",
+    "XYZ123",
+] + yageo_gen.WARMUP_PART_NUMBERS
+
+
+# ============================================================
+# MPN SHAPE FUZZER
+# ============================================================
+
+SIZES = ["0201", "0402", "0603", "0805", "1206", "1210", "2010", "2512"]
+RESISTOR_VALUES = ["10R", "4R99", "1K", "1K0", "10K", "57K6", "100K", "1M", "0R1", "475R"]
+CAPACITOR_DIELECTRICS = ["X7R", "X5R", "NPO", "Y5V"]
+
+
+def _value(rng: random.Random) -> str:
+    return rng.choice(RESISTOR_VALUES) + rng.choice(["L", "P", ""])
+
+
+def _resistor(rng: random.Random, series: str) -> str:
+    rules = yageo_reference.SERIES_RULES[series]
+    size = rng.choice(SIZES)
+    tol = rng.choice("BDFJ")
+    pack = rng.choice(list(rules["packaging_letters"]) + ["Z"])
+    reel = rng.choice(list(rules["reel_codes"]) + ["99"])
+    value = _value(rng)
+
+    shapes = [
+        f"{series}{size}{tol}{pack}-{reel}{value}",   # complete
+        f"{series}{size}{tol}-{value}",               # Case 1: no packaging letter / reel
+        f"{series}{size}{tol}{pack}-{value}",         # Case 2: no reel code
+        f"{series}{size}{tol}{pack}{value}",          # Case 3: no dash
+        f"{series}{size}{tol}{pack}{reel}{value}",    # no dash, reel present
+    ]
+    return rng.choice(shapes)
+
+
+def _capacitor(rng: random.Random, series: str) -> str:
+    rules = yageo_reference.SERIES_RULES[series]
+    size = rng.choice(SIZES)
+    tol = rng.choice("BCDFJKMZ")
+    pack = rng.choice(list(rules["packaging_styles"]) + ["Z"])
+    dielectric = rng.choice(CAPACITOR_DIELECTRICS)
+    voltage = rng.choice("56789AB")
+    code = rng.choice(["104", "105", "224", "475", "120"])
+
+    shapes = [
+        f"{series}{size}{tol}{pack}{dielectric}{voltage}BB{code}",  # complete
+        f"{series}{size}{pack}{dielectric}{code}",                  # Case 4: no packaging style
+        f"{series}{size}",
+    ]
+    return rng.choice(shapes)
+
+
+def _inductor(rng: random.Random) -> str:
+    dims = "".join(rng.choice(string.digits) for _ in range(6))
+    pack = rng.choice("TBX")
+    return f"CL{dims}{pack}-{rng.choice(['1R0M', 'R10K', '100M'])}"
+
+
+def _mov(rng: random.Random) -> str:
+    base = f"{rng.randint(100, 999)}KD{rng.randint(5, 20):02d}"
+    return rng.choice([base, f"{base}-TR"])
+
+
+def _legacy(rng: random.Random) -> str:
+    digits = "".join(rng.choice(string.digits) for _ in range(rng.randint(1, 12)))
+    return f"23{digits}" + rng.choice(["", "L", "LL"])
+
+
+def _mutate(rng: random.Random, pn: str) -> str:
+    """
+    Apply one of the formatting slips customers actually make.
+    """
+    mutation = rng.randrange(5)
+    if mutation == 0:
+        return pn.lower()
+    if mutation == 1:
+        return f"  {pn} "
+    if mutation == 2 and pn:
+        i = rng.randrange(len(pn))
+        return pn[:i] + pn[i + 1:]
+    if mutation == 3:
+        return pn.replace("-", "")
+    return pn
+
+
+def fuzz_part_numbers(count: int, seed: int = 0) -> List[str]:
+    """
+    Generate `count` MPN-shaped strings covering every series, the MOV and
+    legacy formats and every normalizer case, with random mutations.
+    """
+    rng = random.Random(seed)
+    generators = []
+    for series, rules in yageo_reference.SERIES_RULES.items():
+        if rules["family"] == "resistor":
+            generators.append(lambda r, s=series: _resistor(r, s))
+        elif rules["family"] == "capacitor":
+            generators.append(lambda r, s=series: _capacitor(r, s))
+        else:
+            generators.append(_inductor)
+    generators += [_mov, _legacy]
+
+    part_numbers = []
+    for i in range(count):
+        # Round-robin so every shape is covered even for small counts
+        pn = generators[i % len(generators)](rng)
+        if rng.random() < 0.3:
+            pn = _mutate(rng, pn)
+        part_numbers.append(pn)
+
+    return part_numbers
+
+
+# ============================================================
+# PATHS UNDER TEST
+# ============================================================
+
+def _outcome(fn: Callable[[str], Dict], pn: str):
+    """
+    Call one path, capturing an exception as its type and message so that
+    raising the same error counts as identical behaviour.
+    """
+    try:
+        return fn(pn)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def _serialize(outcome) -> str:
+    # json.dumps keeps key and list order, so both take part in the comparison
+    return json.dumps(outcome)
+
+
+def reference_path(part_numbers: List[str]) -> List:
+    return [_outcome(yageo_reference.generate_substitutions, pn) for pn in part_numbers]
+
+
+def direct_path(part_numbers: List[str]) -> List:
+    return [_outcome(yageo_gen.generate_substitutions, pn) for pn in part_numbers]
+
+
+def cached_path(part_numbers: List[str]) -> List:
+    # The same bounded cache the API serves from
+    return [_outcome(yageo_gen.cached_substitutions, pn) for pn in part_numbers]
+
+
+def thread_pool_path(part_numbers: List[str]) -> List:
+    # The same shared pool and cache the batch endpoints use
+    executor = yageo_gen.get_batch_executor()
+    return list(executor.map(lambda pn: _outcome(yageo_gen.cached_substitutions, pn), part_numbers))
+
+
+def _clear_cache(part_numbers: List[str]) -> None:
+    yageo_gen.cached_substitutions.cache_clear()
+
+
+def _prime_cache(part_numbers: List[str]) -> None:
+    yageo_gen.cached_substitutions.cache_clear()
+    cached_path(part_numbers)
+
+
+# name -> (path, setup run untimed before the correctness pass and each timing)
+OPTIMIZED_PATHS = {
+    "direct": (direct_path, None),
+    "cache_cold": (cached_path, _clear_cache),
+    "cache_warm": (cached_path, _prime_cache),
+    "thread_pool": (thread_pool_path, _clear_cache),
+}
+
+
+# ============================================================
+# RUNNER
+# ============================================================
+
+def _best_time(path: Callable[[List[str]], List], part_numbers: List[str], repeat: int,
+               setup: Callable[[List[str]], None] = None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup(part_numbers)
+        start = time.perf_counter()
+        path(part_numbers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_harness(part_numbers: List[str], repeat: int = 3, paths: Dict = None) -> Dict:
+    """
+    Compare every optimized path with the reference in order and time them.
+    Returns a report with mismatches and throughput for each path.
+    """
+    if paths is None:
+        paths = OPTIMIZED_PATHS
+
+    expected = [_serialize(o) for o in reference_path(part_numbers)]
+    reference_time = _best_time(reference_path, part_numbers, repeat)
+
+    report = {
+        "inputs": len(part_numbers),
+        "reference_per_sec": len(part_numbers) / reference_time,
+        "paths": {}
+    }
+
+    for name, (path, setup) in paths.items():
+        if setup is not None:
+            setup(part_numbers)
+        actual = [_serialize(o) for o in path(part_numbers)]
+        mismatches = [
+            {"mpn": pn, "expected": exp, "actual": act}
+            for pn, exp, act in zip(part_numbers, expected, actual)
+            if exp != act
+        ]
+        if len(actual) != len(expected):
+            mismatches.append({"mpn": None, "expected": len(expected), "actual": len(actual)})
+
+        elapsed = _best_time(path, part_numbers, repeat, setup)
+        report["paths"][name] = {
+            "identical": not mismatches,
+            "mismatches": mismatches,
+            "per_sec": len(part_numbers) / elapsed,
+            "speedup": reference_time / elapsed
+        }
+
+    return report
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Differential check of optimized Yageo substitution paths")
+    parser.add_argument("--count", type=int, default=2000, help="Number of fuzzed part numbers")
+    parser.add_argument("--seed", type=int, default=0, help="Fuzzer seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is kept)")
+    args = parser.parse_args(argv)
+
+    part_numbers = CORPUS + fuzz_part_numbers(args.count, args.seed)
+    try:
+        report = run_harness(part_numbers, args.repeat)
+    finally:
+        yageo_gen.shutdown_batch_executor()
+
+    print(f"Inputs: {report['inputs']} (corpus {len(CORPUS)}, fuzzed {args.count}, seed {args.seed}, "
+          f"cache size {yageo_gen.RESULT_CACHE_SIZE})")
+    print(f"{'reference':<12} {report['reference_per_sec']:>12.0f}/s")
+    for name, result in report["paths"].items():
+        status = "IDENTICAL" if result["identical"] else f"{len(result['mismatches'])} MISMATCHES"
+        print(f"{name:<12} {result['per_sec']:>12.0f}/s  x{result['speedup']:.2f}  {status}")
+        for mismatch in result["mismatches"][:5]:
+            print(f"    {mismatch['mpn']!r}")
+            print(f"      expected: {mismatch['expected']}")
+            print(f"      actual:   {mismatch['actual']}")
+
+    return 0 if all(r["identical"] for r in report["paths"].values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,8 @@
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict
 
 # ============================================================
@@ -180,6 +184,46 @@ SERIES_RULES = {
 }
 
 
+# ============================================================
+# PRECOMPILED PATTERNS
+# ============================================================
+
+# Compiled once at import so the first request does not pay for it.
+MOV_PATTERN = re.compile(r"\d{3}KD\d{2}")
+SHORT_RC_PATTERN = re.compile(r"(RC|RT|RL)(\d{4})([A-Z])-(\d+)([A-Z]+)")
+MISSING_REEL_PATTERN = re.compile(r"(RC|RT|RL)(\d{4})([A-Z])([A-Z])-(\d+)([A-Z]+)")
+NO_DASH_PATTERN = re.compile(r"(RC|RT|RL)(\d{4})([A-Z])([A-Z])(\d+)([A-Z]+)")
+CC_MISSING_PACK_PATTERN = re.compile(r"(CC|CQ)(\d{4})([A-Z0-9]+)")
+LEGACY_PATTERN = re.compile(r"^23\d+[A-Z]?$")
+NINE_C_PATTERN = re.compile(r"(9C)(\d{4})([A-Z0-9]+)")
+AT_PATTERN = re.compile(r"(AT)(\d{4})([A-Z0-9]+)")
+AF_PATTERN = re.compile(r"(AF)(\d{4})([A-Z0-9]+)")
+RESISTOR_PATTERN = re.compile(r"([A-Z0-9]{2})(\d{4})([A-Z])([A-Z])-(\d{2})(.*)")
+INDUCTOR_PATTERN = re.compile(r"(CL\d{6})([TB])(.*)")
+
+# One representative part number per series / normalizer case, used to
+# exercise every code path once during startup warm-up.
+WARMUP_PART_NUMBERS = [
+    "RC0402F-475RL",
+    "RC0603FR-1K0L",
+    "RC0603FR1K0L",
+    "RC0603FR-0710KL",
+    "RT0603DRD07127RL",
+    "RL0603FR-070R1L",
+    "9C06031A1001FKHFT",
+    "AT0603BRD0710KL",
+    "AF0603FR-0710KL",
+    "AC0402FR-0751RL",
+    "NR0603FR-0710RL",
+    "LR0603FR-0710RL",
+    "CC0603RX7R104",
+    "CC0603KRX5R7BB475",
+    "CQ0603KRX7R9BB104",
+    "CL201212T-1R0M",
+    "232270672613L",
+]
+
+
 # ============================================================
 # SERIES DETECTION
 # ============================================================
@@ -190,7 +234,7 @@ def detect_series(part_number: str) -> str:
             return series
 
     # MOV example: 271KD07-TR
-    if re.match(r"\d{3}KD\d{2}", part_number):
+    if MOV_PATTERN.match(part_number):
         return "MOV"
 
     return "UNKNOWN"
@@ -205,7 +249,7 @@ def normalize_part_number(part_number: str) -> Dict:
 
     # Case 1: RC / RT / RL missing packaging letter and reel code
     # Example: RC0402F-475RL
-    match_short_rc = re.match(r"(RC|RT|RL)(\d{4})([A-Z])-(\d+)([A-Z]+)", pn)
+    match_short_rc = SHORT_RC_PATTERN.match(pn)
     if match_short_rc:
         series, size, tol, value, suffix = match_short_rc.groups()
         normalized = f"{series}{size}{tol}R-07{value}{suffix}"
@@ -217,7 +261,7 @@ def normalize_part_number(part_number: str) -> Dict:
 
     # Case 2: RC / RT / RL missing reel code only
     # Example: RC0603FR-1K0L
-    match_missing_reel = re.match(r"(RC|RT|RL)(\d{4})([A-Z])([A-Z])-(\d+)([A-Z]+)", pn)
+    match_missing_reel = MISSING_REEL_PATTERN.match(pn)
     if match_missing_reel:
         series, size, tol, pack, value, suffix = match_missing_reel.groups()
         normalized = f"{series}{size}{tol}{pack}-07{value}{suffix}"
@@ -229,7 +273,7 @@ def normalize_part_number(part_number: str) -> Dict:
 
     # Case 3: RC / RT / RL missing dash entirely
     # Example: RC0603FR1K0L
-    match_no_dash = re.match(r"(RC|RT|RL)(\d{4})([A-Z])([A-Z])(\d+)([A-Z]+)", pn)
+    match_no_dash = NO_DASH_PATTERN.match(pn)
     if match_no_dash:
         series, size, tol, pack, value, suffix = match_no_dash.groups()
         normalized = f"{series}{size}{tol}{pack}-07{value}{suffix}"
@@ -241,7 +285,7 @@ def normalize_part_number(part_number: str) -> Dict:
 
     # Case 4: CC / CQ missing packaging style
     # Example: CC0603RX7R104
-    match_cc_missing_pack = re.match(r"(CC|CQ)(\d{4})([A-Z0-9]+)", pn)
+    match_cc_missing_pack = CC_MISSING_PACK_PATTERN.match(pn)
     if match_cc_missing_pack and len(pn) == 6 + len(match_cc_missing_pack.group(3)):
         series, size, rest = match_cc_missing_pack.groups()
         normalized = f"{series}{size}R{rest}"
@@ -270,7 +314,7 @@ def generate_substitutions(part_number: str) -> Dict:
     series = detect_series(part_number)
 
     # Legacy Philips / Yageo numeric part numbers (e.g. 232270672613L)
-    if re.match(r"^23\d+[A-Z]?$", part_number):
+    if LEGACY_PATTERN.match(part_number):
         return {
             "series": "LEGACY_PHILIPS_YAGEO",
             "substitutions": [
@@ -324,7 +368,7 @@ def resistor_substitutions(part_number: str, series: str, normalization_note: st
 
     # Special handling for Yageo 9C automotive resistors (no dash format)
     if series == "9C":
-        match_9c = re.match(r"(9C)(\d{4})([A-Z0-9]+)", part_number)
+        match_9c = NINE_C_PATTERN.match(part_number)
         if not match_9c:
             return []
 
@@ -343,7 +387,7 @@ def resistor_substitutions(part_number: str, series: str, normalization_note: st
 
     # Special handling for Yageo AT thin-film resistors (no dash format)
     if series == "AT" and "-" not in part_number:
-        match_at = re.match(r"(AT)(\d{4})([A-Z0-9]+)", part_number)
+        match_at = AT_PATTERN.match(part_number)
         if not match_at:
             return []
 
@@ -362,7 +406,7 @@ def resistor_substitutions(part_number: str, series: str, normalization_note: st
 
     # Special handling for Yageo AF anti-sulfur resistors (no dash format)
     if series == "AF" and "-" not in part_number:
-        match_af = re.match(r"(AF)(\d{4})([A-Z0-9]+)", part_number)
+        match_af = AF_PATTERN.match(part_number)
         if not match_af:
             return []
 
@@ -379,7 +423,7 @@ def resistor_substitutions(part_number: str, series: str, normalization_note: st
 
         return output
 
-    match = re.match(r"([A-Z0-9]{2})(\d{4})([A-Z])([A-Z])-(\d{2})(.*)", part_number)
+    match = RESISTOR_PATTERN.match(part_number)
     if not match:
         return []
 
@@ -453,7 +497,7 @@ def capacitor_substitutions(part_number: str, series: str, normalization_note: s
 def inductor_substitutions(part_number: str, normalization_note: str = None) -> List[Dict]:
     output = []
 
-    match = re.match(r"(CL\d{6})([TB])(.*)", part_number)
+    match = INDUCTOR_PATTERN.match(part_number)
     if not match:
         return []
 
@@ -507,6 +551,70 @@ def mov_substitutions(part_number: str, normalization_note: str = None) -> List[
     return output
 
 
+# ============================================================
+# SHARED RESULT CACHE AND WORKER POOL
+# ============================================================
+
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "4096"))
+BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", "20"))
+
+# Results are only read when building responses, so they can be shared
+cached_substitutions = lru_cache(maxsize=RESULT_CACHE_SIZE)(generate_substitutions)
+
+_batch_executor = None
+_batch_executor_lock = threading.Lock()
+
+
+def get_batch_executor() -> ThreadPoolExecutor:
+    """
+    Shared batch worker pool, created on first use.
+    """
+    global _batch_executor
+    with _batch_executor_lock:
+        if _batch_executor is None:
+            _batch_executor = ThreadPoolExecutor(max_workers=BATCH_WORKERS)
+        return _batch_executor
+
+
+def start_batch_workers() -> None:
+    """
+    Force every worker thread to start. Idle workers are reused, so each task
+    blocks on a shared barrier until all of them are running at once.
+    """
+    executor = get_batch_executor()
+    barrier = threading.Barrier(BATCH_WORKERS + 1)
+    for _ in range(BATCH_WORKERS):
+        executor.submit(barrier.wait)
+    barrier.wait()
+
+
+def shutdown_batch_executor() -> None:
+    global _batch_executor
+    with _batch_executor_lock:
+        if _batch_executor is not None:
+            _batch_executor.shutdown(wait=True)
+            _batch_executor = None
+
+
+# ============================================================
+# WARM-UP
+# ============================================================
+
+def warm_up(part_numbers: List[str] = None) -> int:
+    """
+    Run the full substitution pipeline once per part number so every
+    normalizer and series branch is exercised before serving traffic.
+    Returns the number of part numbers processed.
+    """
+    if part_numbers is None:
+        part_numbers = WARMUP_PART_NUMBERS
+
+    for pn in part_numbers:
+        generate_substitutions(pn)
+
+    return len(part_numbers)
+
+
 
 
 #  test_pn = [
@@ -1,15 +1,66 @@
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
 from io import BytesIO
+import asyncio
+import logging
+import os
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment
-from brands.yageo.yageo_gen import generate_substitutions
+from brands.yageo.yageo_gen import (
+    cached_substitutions,
+    get_batch_executor,
+    shutdown_batch_executor,
+    start_batch_workers,
+    warm_up,
+)
+
+logger = logging.getLogger(__name__)
+
+# Comma-separated list of top MPNs to prime the result cache with
+WARMUP_MPNS = [mpn.strip() for mpn in os.getenv("WARMUP_MPNS", "").split(",") if mpn.strip()]
+
+
+def warm_up_instance() -> None:
+    """
+    Exercise every pattern and series branch, touch openpyxl's writer and
+    prime the result cache with the configured top MPNs, then mark ready.
+    """
+    warm_up()
+    openpyxl.Workbook().save(BytesIO())
+
+    for mpn in WARMUP_MPNS:
+        try:
+            cached_substitutions(mpn)
+        except Exception as e:
+            # A bad config entry must not keep the instance from coming up
+            logger.warning("Skipping warm-up MPN %r: %s: %s", mpn, type(e).__name__, e)
 
-app = FastAPI()
+    app.state.ready = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start the shared worker pool, then warm up in the background so the
+    server accepts connections and /ready answers 503 until warm-up is done.
+    """
+    app.state.ready = False
+    start_batch_workers()
+
+    warm_up_task = asyncio.create_task(asyncio.to_thread(warm_up_instance))
+    yield
+
+    app.state.ready = False
+    await warm_up_task
+    shutdown_batch_executor()
+
+
+app = FastAPI(lifespan=lifespan)
 
 class BatchRequest(BaseModel):
     brand: str
@@ -28,6 +79,15 @@ app.add_middleware(
 def read_health():
     return {"status": "Healthy"}
 
+@app.get("/ready")
+def read_ready():
+    """
+    Readiness probe: 503 until the startup warm-up has finished.
+    """
+    if not getattr(app.state, "ready", False):
+        return JSONResponse(status_code=503, content={"status": "Warming up"})
+    return {"status": "Ready"}
+
 @app.get("/api/generate")
 def generate_part_substitutions(
     brand: str = Query(..., description="Brand name (e.g., yageo)"),
@@ -44,7 +104,7 @@ def generate_part_substitutions(
             "substitutions": []
         }
     
-    result = generate_substitutions(mpn)
+    result = cached_substitutions(mpn)
     
     return {
         "brand": brand,
@@ -68,16 +128,15 @@ def generate_batch_substitutions(request: BatchRequest):
         }
     
     def process_single_mpn(mpn: str):
-        result = generate_substitutions(mpn)
+        result = cached_substitutions(mpn)
         return {
             "mpn": mpn,
             "series": result["series"],
             "substitutions": result["substitutions"]
         }
     
-    # Process MPNs in parallel using ThreadPoolExecutor
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        results = list(executor.map(process_single_mpn, request.mpns))
+    # Process MPNs in parallel on the shared worker pool
+    results = list(get_batch_executor().map(process_single_mpn, request.mpns))
     
     return {
         "brand": request.brand,
@@ -97,7 +156,7 @@ def export_batch_to_excel(request: BatchRequest):
         }
     
     def process_single_mpn(mpn: str):
-        result = generate_substitutions(mpn)
+        result = cached_substitutions(mpn)
         return {
             "mpn": mpn,
             "series": result["series"],
@@ -105,8 +164,7 @@ def export_batch_to_excel(request: BatchRequest):
         }
     
     # Process MPNs in parallel
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        results = list(executor.map(process_single_mpn, request.mpns))
+    results = list(get_batch_executor().map(process_single_mpn, request.mpns))
     
     # Create Excel workbook
     wb = openpyxl.Workbook()
@@ -149,7 +207,6 @@ def export_batch_to_excel(request: BatchRequest):
     excel_file.seek(0)
     
     # Generate filename with timestamp
-    from datetime import datetime
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"yageo_substitutions_{timestamp}.xlsx"
     